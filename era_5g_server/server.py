@@ -1,18 +1,177 @@
 import logging
+import queue
 from multiprocessing import Process
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+import engineio
+import msgpack
+import numpy as np
+import orjson
 import socketio
-import ujson
+from engineio import packet
 from engineio.payload import Payload
-from flask import Flask
-
-from era_5g_interface.channels import COMMAND_ERROR_EVENT, CONTROL_NAMESPACE, DATA_NAMESPACE, CallbackInfoServer
-from era_5g_interface.dataclasses.control_command import ControlCommand
+from lz4.frame import compress
+from werkzeug.serving import run_simple
+
+from era_5g_interface.channels import (
+    COMMAND_ERROR_EVENT,
+    CONTROL_NAMESPACE,
+    DATA_NAMESPACE,
+    CallbackInfoServer,
+    ChannelType,
+)
+from era_5g_interface.dataclasses.control_command import ControlCmdType, ControlCommand
+from era_5g_interface.exceptions import BackPressureException, UnknownChannelTypeUsed
 from era_5g_interface.server_channels import ServerChannels
 
 logger = logging.getLogger(__name__)
 
+ASYNC_MODES = ("threading", "eventlet", "gevent")
+
+# Numpy arrays are serialized natively, non-str dict keys are converted to str like in ujson.
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# MessagePack extension type code of numpy arrays.
+NDARRAY_EXT_TYPE = 1
+
+# Max number of data items sent in one send_data_batch message.
+MAX_BATCH_SIZE = 100
+
+
+def ndarray_msgpack_default(obj: Any) -> Any:
+    """MessagePack default hook, packs numpy arrays as NDARRAY_EXT_TYPE extension (shape, dtype, raw buffer).
+
+    Args:
+        obj (Any): Object not supported by MessagePack.
+
+    Returns:
+        Supported object.
+    """
+
+    if isinstance(obj, np.ndarray) and not obj.dtype.hasobject:
+        # Field names of structured arrays are not part of dtype.str, they would be lost.
+        if obj.dtype.fields is not None:
+            raise TypeError(f"Structured numpy array with dtype {obj.dtype} is not MessagePack serializable.")
+        return msgpack.ExtType(
+            NDARRAY_EXT_TYPE, msgpack.packb((obj.shape, obj.dtype.str, np.ascontiguousarray(obj).data))
+        )
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj)} is not MessagePack serializable.")
+
+
+def ndarray_msgpack_ext_hook(code: int, data: bytes) -> Any:
+    """MessagePack ext hook, unpacks numpy arrays packed by ndarray_msgpack_default.
+
+    E.g. msgpack.unpackb(data, ext_hook=ndarray_msgpack_ext_hook).
+
+    Args:
+        code (int): Extension type code.
+        data (bytes): Extension data.
+
+    Returns:
+        Unpacked object.
+    """
+
+    if code == NDARRAY_EXT_TYPE:
+        shape, dtype, buffer = msgpack.unpackb(data)
+        return np.frombuffer(buffer, dtype=np.dtype(dtype)).reshape(shape)
+    return msgpack.ExtType(code, data)
+
+
+def _json_lz4_compress(data: Dict[str, Any]) -> bytes:
+    """Serialize JSON data and compress it to the LZ4 frame expected by ChannelType.JSON_LZ4 receivers.
+
+    Args:
+        data (Dict[str, Any]): JSON data.
+
+    Returns:
+        LZ4 compressed JSON data.
+    """
+
+    # Fastest compression level and independent blocks, the result is a standard LZ4 frame.
+    compressed: bytes = compress(orjson.dumps(data, option=ORJSON_OPTIONS), compression_level=0, block_linked=False)
+    return compressed
+
+
+class _OrjsonAdapter:
+    """The json module interface (dumps and loads) used by Socket.IO and Engine.IO, implemented with orjson.
+
+    Unlike ujson, NaN and Infinity floats are serialized as null and integers out of the 64-bit range raise TypeError.
+    """
+
+    @staticmethod
+    def dumps(obj: Any, **kwargs) -> str:
+        # Other arguments (e.g. separators) are ignored, orjson output is always compact.
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode()
+
+    @staticmethod
+    def loads(s: Any, **kwargs) -> Any:
+        return orjson.loads(s)
+
+
+class _BoundedSendQueue(queue.Queue):
+    """Engine.IO socket send queue with bounded number of messages.
+
+    Putting a message to the full queue never blocks or raises. The message is dropped together with all following
+    messages and on_full is called to close the connection of the slow client, so the client never receives a partial
+    event (e.g. the binary placeholder without its attachment). Engine.IO control packets (e.g. ping or close) and the
+    None packet which unlocks the socket writer are never dropped, otherwise the socket could not be closed.
+    """
+
+    def __init__(self, maxsize: int, on_full: Callable[["_BoundedSendQueue"], None]) -> None:
+        super().__init__(maxsize)
+        self._on_full = on_full
+        self._overflowed = False
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        is_message = item is not None and item.packet_type == packet.MESSAGE
+        with self.mutex:
+            if is_message and self._overflowed:
+                return
+            if is_message and self._qsize() >= self.maxsize:
+                self._overflowed = True
+            else:
+                self._put(item)
+                self.unfinished_tasks += 1
+                self.not_empty.notify()
+                return
+        self._on_full(self)
+
+
+class _EngineIOServer(engineio.Server):
+    """Engine.IO server with disabled per-message websocket compression and optionally bounded send queues."""
+
+    def __init__(self, *args, queue_maxsize: Optional[int] = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._queue_maxsize = queue_maxsize
+
+    def create_queue(self, *args, **kwargs):
+        if self._queue_maxsize is None or args or kwargs:
+            return super().create_queue(*args, **kwargs)
+        return _BoundedSendQueue(self._queue_maxsize, self._close_overflowed_socket)
+
+    def _close_overflowed_socket(self, send_queue: _BoundedSendQueue) -> None:
+        for eio_sid, eio_socket in list(self.sockets.items()):
+            if eio_socket.queue is send_queue:
+                logger.warning("Send queue of client %s is full, closing the connection", eio_sid)
+                # Closed in the background, the disconnect handlers must not run inside of the emit call.
+                self.start_background_task(eio_socket.close, wait=False)
+                return
+
+    def handle_request(self, environ, start_response):
+        # The websocket servers accept permessage-deflate whenever the client offers it. Hiding the client offer keeps
+        # the handshake valid and the connection uncompressed for all async modes.
+        environ.pop("HTTP_SEC_WEBSOCKET_EXTENSIONS", None)
+        return super().handle_request(environ, start_response)
+
+
+class _SocketIOServer(socketio.Server):
+    """Socket.IO server using _EngineIOServer."""
+
+    def _engineio_server_class(self):
+        return _EngineIOServer
+
 
 class NetworkApplicationServer(Process):
     """Basic implementation of the 5G-ERA Network Application server.
@@ -23,6 +182,9 @@ class NetworkApplicationServer(Process):
         client.send_image(frame, "image", ChannelType.JPEG, timestamp, metadata, sid)
         client.send_data({"message": "message text"}, "event_name", sid=sid)
         client.send_data({"message": "message text"}, "event_name", ChannelType.JSON_LZ4, sid=sid)
+        client.send_data_batch([{"message": "first"}, {"message": "second"}], "event_name", sid=sid)
+        client.broadcast_data({"message": "message text"}, "event_name", sids=[sid1, sid2])
+        client.send_binary({"positions": np.zeros((100, 3))}, "event_name", sid=sid)
     How to create callbacks_info? E.g.:
         {
             "results": CallbackInfoServer(ChannelType.JSON, results_callback),
@@ -46,6 +208,11 @@ class NetworkApplicationServer(Process):
         host: str = "0.0.0.0",
         async_handlers: bool = False,
         max_message_size: float = 5,
+        async_mode: str = "threading",
+        max_decode_packets: int = 50,
+        eio_queue_maxsize: Optional[int] = None,
+        client_manager_factory: Optional[Callable[[], socketio.Manager]] = None,
+        extra_wsgi_app: Optional[Callable] = None,
         **kwargs,
     ) -> None:
         """Constructor.
@@ -63,41 +230,115 @@ class NetworkApplicationServer(Process):
             host (str): The IP address of the interface, where the websocket server should run. Defaults to "0.0.0.0".
             async_handlers (bool): Specify, if the incoming messages. Defaults to False.
             max_message_size (float): The maximum size of the message to be passed in MB. Defaults to 5.
+            async_mode (str): The async mode of the server: "threading", "eventlet" or "gevent". The "eventlet" and
+                "gevent" modes serve all connections from a single event loop, the eventlet or gevent package must be
+                installed and the standard library should be monkey patched. Defaults to "threading".
+            max_decode_packets (int): The max number of packets in one HTTP long-polling payload. Defaults to 50.
+            eio_queue_maxsize (int, optional): The max number of messages in the send queue of each client (only
+                "threading" async mode is supported). Sending never blocks, the client with the full queue is
+                considered too slow, its further messages are dropped and its connection is closed (disconnect
+                callbacks are called). Sending of data which can be dropped should be limited by smaller
+                back_pressure_size. Defaults to None (unbounded).
+            client_manager_factory (Callable[[], socketio.Manager], optional): Factory of the Socket.IO client
+                manager, e.g. functools.partial(socketio.RedisManager, "redis://"). RedisManager or KombuManager allows
+                to run several server processes (on more CPU cores) behind a load balancer and to emit to clients
+                connected to any of them. The manager is created in the server process, the factory has to be
+                picklable if the process is spawned. Defaults to None (in-process manager).
+            extra_wsgi_app (Callable, optional): WSGI application (e.g. Flask app) serving other HTTP requests than
+                Socket.IO ones. Defaults to None.
             **kwargs: Process arguments.
         """
 
         super().__init__(*args, **kwargs)
 
+        if async_mode not in ASYNC_MODES:
+            raise ValueError(f"Unsupported async_mode: {async_mode}, supported are {ASYNC_MODES}.")
+        if eio_queue_maxsize is not None:
+            if eio_queue_maxsize < 1:
+                raise ValueError("Invalid value for eio_queue_maxsize.")
+            if async_mode != "threading":
+                raise ValueError("eio_queue_maxsize is supported only in threading async mode.")
+
+        if back_pressure_size is not None and back_pressure_size < 1:
+            raise ValueError("Invalid value for back_pressure_size.")
+
+        # Store constructor arguments, the Socket.IO server and channels are created in the server process by _setup.
+        self._callbacks_info = callbacks_info
+        self._back_pressure_size = back_pressure_size
+        self._recreate_coder_attempts_count = recreate_coder_attempts_count
+        self._disconnect_on_unhandled = disconnect_on_unhandled
+        self._stats = stats
+        self._async_handlers = async_handlers
+        self._max_message_size = max_message_size
+        self._max_decode_packets = max_decode_packets
+        self._eio_queue_maxsize = eio_queue_maxsize
+        self._client_manager_factory = client_manager_factory
+        self._extra_wsgi_app = extra_wsgi_app
+        self._is_set_up = False
+
+        # Save custom command and disconnect callbacks.
+        self._command_callback = command_callback
+        self._disconnect_callback = disconnect_callback
+
+        # Control command handlers registered for specific command types.
+        self._command_handlers: Dict[ControlCmdType, Callable[[ControlCommand, str], Tuple[bool, str]]] = dict()
+
+        # Store host, port and async mode.
+        self._port = port
+        self._host = host
+        self._async_mode = async_mode
+
+        # Number of data dropped due to back pressure, in total and per DATA_NAMESPACE sid of connected clients.
+        self._dropped_count = 0
+        self._dropped_counts: Dict[str, int] = dict()
+
+        # Greeting messages sent to connected clients, namespace sid is appended.
+        self._data_greeting = f"You are connected to {DATA_NAMESPACE} namespace "
+        self._control_greeting = f"You are connected to {CONTROL_NAMESPACE} namespace "
+
+        # Cached sid lookups of connected clients, indexed by Tuple(eio_sid, namespace) and Tuple(sid, namespace).
+        self._sid_cache: Dict[Tuple[str, str], str] = dict()
+        self._eio_sid_cache: Dict[Tuple[str, str], str] = dict()
+
+    def _setup(self) -> None:
+        """Create the Socket.IO server, the WSGI application and channels.
+
+        It is called by run_server, so that nothing is created in the parent process and copied to the server process.
+        """
+
+        if self._is_set_up:
+            return
+
         # To get rid of ValueError: Too many packets in payload.
         # (see https://github.com/miguelgrinberg/python-engineio/issues/142)
-        Payload.max_decode_packets = 50
+        Payload.max_decode_packets = self._max_decode_packets
 
         # Create Socket.IO Client.
         # The max_http_buffer_size parameter defines the max size of the message to be passed.
-        self._sio = socketio.Server(
-            async_mode="threading",
-            async_handlers=async_handlers,
-            max_http_buffer_size=max_message_size * (1024**2),
-            json=ujson,
+        # Compression is disabled (HTTP compression for polling and permessage-deflate for websocket), it is expensive
+        # for many small messages and useless for already compressed data (JPEG, H.264, HEVC, LZ4).
+        self._sio = _SocketIOServer(
+            client_manager=self._client_manager_factory() if self._client_manager_factory is not None else None,
+            async_mode=self._async_mode,
+            async_handlers=self._async_handlers,
+            max_http_buffer_size=self._max_message_size * (1024**2),
+            http_compression=False,
+            json=_OrjsonAdapter,
+            queue_maxsize=self._eio_queue_maxsize,
         )
-        self._app = Flask(__name__)
-        self._app.wsgi_app = socketio.WSGIApp(self._sio, self._app.wsgi_app)  # type: ignore
+        self._app = socketio.WSGIApp(self._sio, self._extra_wsgi_app)
 
         # Create channels - custom callbacks and send functions including encoding.
         # NOTE: DATA_NAMESPACE is assumed to be or will be a connected namespace.
         self._channels = ServerChannels(
             self._sio,
-            callbacks_info=callbacks_info,
-            disconnect_callback=self._sio.disconnect if disconnect_on_unhandled else None,
-            back_pressure_size=back_pressure_size,
-            recreate_coder_attempts_count=recreate_coder_attempts_count,
-            stats=stats,
+            callbacks_info=self._callbacks_info,
+            disconnect_callback=self._sio.disconnect if self._disconnect_on_unhandled else None,
+            back_pressure_size=self._back_pressure_size,
+            recreate_coder_attempts_count=self._recreate_coder_attempts_count,
+            stats=self._stats,
         )
 
-        # Save custom command and disconnect callbacks.
-        self._command_callback = command_callback
-        self._disconnect_callback = disconnect_callback
-
         # Register connect, disconnect a command callbacks.
         self._sio.on("connect", self.data_connect_callback, namespace=DATA_NAMESPACE)
         self._sio.on("connect", self.control_connect_callback, namespace=CONTROL_NAMESPACE)
@@ -107,18 +348,31 @@ class NetworkApplicationServer(Process):
         self._sio.on("disconnect", self.data_disconnect_callback, namespace=DATA_NAMESPACE)
         self._sio.on("disconnect", self.control_disconnect_callback, namespace=CONTROL_NAMESPACE)
 
-        # Store host and port.
-        self._port = port
-        self._host = host
-
-        # Substitute send function calls.
-        self.send_image = self._channels.send_image
-        self.send_data = self._channels.send_data
+        self._is_set_up = True
 
     def run_server(self) -> None:
         """Run server."""
 
-        self._app.run(port=self._port, host=self._host)
+        self._setup()
+
+        if self._async_mode == "eventlet":
+            import eventlet  # pants: no-infer-dep
+            import eventlet.wsgi  # pants: no-infer-dep
+
+            eventlet.wsgi.server(eventlet.listen((self._host, self._port)), self._app)
+        elif self._async_mode == "gevent":
+            from gevent import pywsgi  # pants: no-infer-dep
+
+            try:
+                from geventwebsocket.handler import WebSocketHandler  # pants: no-infer-dep
+
+                handler_class = WebSocketHandler
+            except ImportError:
+                # The simple-websocket package is used by engineio instead.
+                handler_class = pywsgi.WSGIHandler
+            pywsgi.WSGIServer((self._host, self._port), self._app, handler_class=handler_class).serve_forever()
+        else:
+            run_simple(self._host, self._port, self._app, threaded=True)
 
     def get_sid_of_namespace(self, eio_sid: str, namespace: str) -> str:
         """Get namespace sid.
@@ -131,7 +385,15 @@ class NetworkApplicationServer(Process):
             Namespace sid.
         """
 
-        return str(self._sio.manager.sid_from_eio_sid(eio_sid, namespace))
+        key = (eio_sid, namespace)
+        sid = self._sid_cache.get(key)
+        if sid is None:
+            sid = str(self._sio.manager.sid_from_eio_sid(eio_sid, namespace))
+            # Only sids of connected clients are cached, not the ones being disconnected (the disconnect handler was
+            # already called and the sid would not be forgotten).
+            if self._sio.manager.is_connected(sid, namespace):
+                self._sid_cache[key] = sid
+        return sid
 
     def get_eio_sid_of_namespace(self, sid: str, namespace: str) -> str:
         """Get client eio sid.
@@ -144,7 +406,26 @@ class NetworkApplicationServer(Process):
             Client eio sid.
         """
 
-        return self._channels.get_client_eio_sid(sid, namespace)
+        key = (sid, namespace)
+        eio_sid = self._eio_sid_cache.get(key)
+        if eio_sid is None:
+            eio_sid = self._channels.get_client_eio_sid(sid, namespace)
+            # Only eio sids of connected clients are cached, not the ones being disconnected.
+            if eio_sid != "None" and self._sio.manager.is_connected(sid, namespace):
+                self._eio_sid_cache[key] = eio_sid
+        return eio_sid
+
+    def _forget_sid(self, sid: str, eio_sid: str, namespace: str) -> None:
+        """Remove cached sid lookups of disconnected client.
+
+        Args:
+            sid (str): Namespace sid.
+            eio_sid (str): Client eio sid.
+            namespace (str): Namespace.
+        """
+
+        self._eio_sid_cache.pop((sid, namespace), None)
+        self._sid_cache.pop((eio_sid, namespace), None)
 
     def get_sid_of_data(self, eio_sid: str) -> str:
         """Get DATA_NAMESPACE sid.
@@ -180,7 +461,7 @@ class NetworkApplicationServer(Process):
             Client eio sid of DATA_NAMESPACE.
         """
 
-        return self._channels.get_client_eio_sid(sid, DATA_NAMESPACE)
+        return self.get_eio_sid_of_namespace(sid, DATA_NAMESPACE)
 
     def get_eio_sid_of_control(self, sid: str) -> str:
         """Get client eio sid of CONTROL_NAMESPACE.
@@ -192,7 +473,230 @@ class NetworkApplicationServer(Process):
             Client eio sid of CONTROL_NAMESPACE.
         """
 
-        return self._channels.get_client_eio_sid(sid, CONTROL_NAMESPACE)
+        return self.get_eio_sid_of_namespace(sid, CONTROL_NAMESPACE)
+
+    def send_image(
+        self,
+        frame: np.ndarray,
+        event: str,
+        channel_type: ChannelType,
+        timestamp: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        sid: Optional[str] = None,
+        can_be_dropped: bool = True,
+        wait_for_reconnection: bool = True,
+        blocking: bool = False,
+        encoding_options: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Send general image data with JPEG or H.264 or HEVC encoding via DATA_NAMESPACE.
+
+        See ServerChannels.send_image. If the frame can be dropped and the client send queue size exceeds
+        back_pressure_size, the frame is dropped, counted and BackPressureException is raised.
+
+        Args:
+            frame (np.ndarray): Video frame / image.
+            event (str): Event name.
+            channel_type (ChannelType): Encoding type - ChannelType.JPEG or ChannelType.H264 or ChannelType.HEVC.
+            timestamp (int): Frame timestamp.
+            metadata (Dict[str, Any], optional): Optional metadata to send.
+            sid (str, optional): Namespace sid.
+            can_be_dropped (bool): If data can be lost due to back pressure.
+            wait_for_reconnection (bool): Unused on the server side.
+            blocking (bool): Unused on the server side.
+            encoding_options (Dict[str, str], optional): Video codec options.
+        """
+
+        try:
+            return self._channels.send_image(
+                frame,
+                event,
+                channel_type,
+                timestamp,
+                metadata,
+                sid,
+                can_be_dropped,
+                wait_for_reconnection,
+                blocking,
+                encoding_options,
+            )
+        except BackPressureException:
+            self._count_dropped(sid)
+            raise
+
+    def send_data(
+        self,
+        data: Dict[str, Any],
+        event: str,
+        channel_type: ChannelType = ChannelType.JSON,
+        sid: Optional[str] = None,
+        can_be_dropped: bool = False,
+        wait_for_reconnection: bool = True,
+        blocking: bool = False,
+    ) -> Any:
+        """Send general JSON data via DATA_NAMESPACE.
+
+        See ServerChannels.send_data. If the data can be dropped and the client send queue size exceeds
+        back_pressure_size, the data is dropped, counted and BackPressureException is raised.
+
+        Args:
+            data (Dict[str, Any]): JSON data.
+            event (str): Event name.
+            channel_type (ChannelType): ChannelType.JSON for raw JSON or ChannelType.JSON_LZ4 for LZ4 compressed JSON.
+            sid (str, optional): Namespace sid.
+            can_be_dropped (bool): If data can be lost due to back pressure.
+            wait_for_reconnection (bool): Unused on the server side.
+            blocking (bool): If True, wait for the response. Defaults to False.
+        """
+
+        # Back pressure is checked here, before the data which would be dropped is compressed.
+        if can_be_dropped and self._back_pressure_size is not None:
+            if sid is None:
+                raise ValueError("'sid' has to be set for server.")
+            if self._is_back_pressured(self.get_eio_sid_of_data(sid)):
+                self._count_dropped(sid)
+                raise BackPressureException()
+
+        new_data: Any = data
+        if channel_type is ChannelType.JSON_LZ4:
+            # The data is compressed here (using orjson) and passed to the channels as already encoded data.
+            new_data = _json_lz4_compress(data)
+            channel_type = ChannelType.JSON
+        return self._channels.send_data(new_data, event, channel_type, sid, False, wait_for_reconnection, blocking)
+
+    def _count_dropped(self, sid: Optional[str]) -> None:
+        """Count data dropped due to back pressure.
+
+        Args:
+            sid (str, optional): Namespace sid.
+        """
+
+        self._dropped_count += 1
+        if sid is not None:
+            self._dropped_counts[sid] = self._dropped_counts.get(sid, 0) + 1
+        logger.debug("Data dropped due to back pressure, sid %s", sid)
+
+    def get_dropped_count(self, sid: Optional[str] = None) -> int:
+        """Get number of data dropped due to back pressure.
+
+        Args:
+            sid (str, optional): DATA_NAMESPACE sid of a connected client. If not set, total count is returned.
+
+        Returns:
+            Number of dropped data.
+        """
+
+        if sid is None:
+            return self._dropped_count
+        return self._dropped_counts.get(sid, 0)
+
+    def send_data_batch(
+        self, data: List[Dict[str, Any]], event: str, sid: str, max_batch_size: int = MAX_BATCH_SIZE
+    ) -> None:
+        """Send several general JSON data items as a list in one message via DATA_NAMESPACE.
+
+        One message (WebSocket frame) is sent for up to max_batch_size items instead of one message per item. The
+        client callback of the event receives the list of items.
+
+        Args:
+            data (List[Dict[str, Any]]): JSON data items.
+            event (str): Event name.
+            sid (str): Namespace sid.
+            max_batch_size (int): Max number of items in one message. Defaults to MAX_BATCH_SIZE.
+        """
+
+        if max_batch_size < 1:
+            raise ValueError("Invalid value for max_batch_size.")
+        if not self._sio.manager.is_connected(sid, DATA_NAMESPACE):
+            raise ConnectionError(f"Client with {DATA_NAMESPACE} sid {sid} is not connected to server.")
+
+        for i in range(0, len(data), max_batch_size):
+            self._sio.emit(event, data[i : i + max_batch_size], namespace=DATA_NAMESPACE, to=sid)
+
+    def broadcast_data(
+        self,
+        data: Dict[str, Any],
+        event: str,
+        channel_type: ChannelType = ChannelType.JSON,
+        sids: Optional[Iterable[str]] = None,
+        can_be_dropped: bool = False,
+    ) -> None:
+        """Send the same general JSON data to several clients via DATA_NAMESPACE.
+
+        The message is serialized (and compressed) only once and the same packet is sent to all clients. If the data
+        can be dropped, clients (connected to this server process) with the send queue size exceeding
+        back_pressure_size are skipped and the data is counted as dropped for them.
+
+        Args:
+            data (Dict[str, Any]): JSON data.
+            event (str): Event name.
+            channel_type (ChannelType): ChannelType.JSON for raw JSON or ChannelType.JSON_LZ4 for LZ4 compressed JSON.
+            sids (Iterable[str], optional): Namespace sids of the clients. If not set, data is sent to all clients
+                connected to DATA_NAMESPACE.
+            can_be_dropped (bool): If data can be lost due to back pressure.
+        """
+
+        if channel_type is not ChannelType.JSON and channel_type is not ChannelType.JSON_LZ4:
+            raise UnknownChannelTypeUsed()
+
+        to = None
+        if sids is not None:
+            to = list(sids)
+            if not to:
+                return
+
+        new_data: Any = data
+        if channel_type is ChannelType.JSON_LZ4:
+            new_data = _json_lz4_compress(data)
+
+        skip_sids = None
+        if can_be_dropped and self._back_pressure_size is not None:
+            if to is None:
+                participants = self._sio.manager.get_participants(DATA_NAMESPACE, None)
+            else:
+                participants = ((sid, self._sio.manager.eio_sid_from_sid(sid, DATA_NAMESPACE)) for sid in to)
+            skip_sids = [sid for sid, eio_sid in participants if self._is_back_pressured(eio_sid)]
+            for sid in skip_sids:
+                self._count_dropped(sid)
+
+        # Socket.IO encodes the packet once for all recipients if no callback is used.
+        self._sio.emit(event, new_data, namespace=DATA_NAMESPACE, to=to, skip_sid=skip_sids or None)
+
+    def _is_back_pressured(self, eio_sid: Optional[str]) -> bool:
+        """Check whether the send queue size of the client exceeds back_pressure_size.
+
+        Args:
+            eio_sid (str, optional): Engine.IO sid of the client.
+
+        Returns:
+            False if back_pressure_size is not set or the client is not connected to this server process, otherwise
+            whether the send queue size exceeds back_pressure_size.
+        """
+
+        if self._back_pressure_size is None:
+            return False
+        eio_socket = self._sio.eio.sockets.get(eio_sid)
+        return eio_socket is not None and eio_socket.queue.qsize() > self._back_pressure_size
+
+    def send_binary(self, data: Dict[str, Any], event: str, sid: str, use_single_float: bool = False) -> None:
+        """Send general data packed with MessagePack as a binary message via DATA_NAMESPACE.
+
+        It is faster and smaller than JSON for numeric data. Numpy arrays are packed as raw buffers, the client can
+        unpack data with msgpack.unpackb(data, ext_hook=ndarray_msgpack_ext_hook).
+
+        Args:
+            data (Dict[str, Any]): Data.
+            event (str): Event name.
+            sid (str): Namespace sid.
+            use_single_float (bool): Pack Python floats as 32-bit floats. Defaults to False.
+        """
+
+        if not self._sio.manager.is_connected(sid, DATA_NAMESPACE):
+            raise ConnectionError(f"Client with {DATA_NAMESPACE} sid {sid} is not connected to server.")
+
+        packed_data = msgpack.packb(
+            data, default=ndarray_msgpack_default, use_bin_type=True, use_single_float=use_single_float
+        )
+        self._sio.emit(event, packed_data, namespace=DATA_NAMESPACE, to=sid)
 
     def send_command_error(self, message: str, sid: str):
         """Send control command error message to client.
@@ -212,11 +716,10 @@ class NetworkApplicationServer(Process):
             environ (Dict): WSGI environ dictionary.
         """
 
-        logger.info(
-            f"Client {self._channels.get_client_eio_sid(sid, DATA_NAMESPACE)} connected to {DATA_NAMESPACE} "
-            f"namespace {sid}, environ {environ}"
-        )
-        self._sio.send(f"You are connected to {DATA_NAMESPACE} namespace {sid}", namespace=DATA_NAMESPACE)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Client %s connected to %s namespace %s", self.get_eio_sid_of_data(sid), DATA_NAMESPACE, sid)
+        logger.debug("Client environ %s", environ)
+        self._sio.send(self._data_greeting + sid, namespace=DATA_NAMESPACE, to=sid)
 
     def control_connect_callback(self, sid: str, environ: Dict) -> None:
         """On connect to CONTROL_NAMESPACE namespace callback.
@@ -226,11 +729,12 @@ class NetworkApplicationServer(Process):
             environ (Dict): WSGI environ dictionary.
         """
 
-        logger.info(
-            f"Client {self._channels.get_client_eio_sid(sid, CONTROL_NAMESPACE)} connected to {CONTROL_NAMESPACE} "
-            f"namespace {sid}, environ {environ}"
-        )
-        self._sio.send(f"You are connected to {CONTROL_NAMESPACE} namespace {sid}", namespace=CONTROL_NAMESPACE)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Client %s connected to %s namespace %s", self.get_eio_sid_of_control(sid), CONTROL_NAMESPACE, sid
+            )
+        logger.debug("Client environ %s", environ)
+        self._sio.send(self._control_greeting + sid, namespace=CONTROL_NAMESPACE, to=sid)
 
     def control_command_callback(self, sid: str, data: Dict[str, Any]) -> Tuple[bool, str]:
         """Control command callback, parses control command data and call custom callback.
@@ -245,26 +749,44 @@ class NetworkApplicationServer(Process):
 
         try:
             control_command = ControlCommand(**data)
+            # Raises TypeError for unhashable cmd_type, e.g. a list.
+            handler = self._command_handlers.get(control_command.cmd_type)
         except TypeError as e:
-            logger.error(f"Could not parse Control Command. {repr(e)}")
-            self._sio.emit(
-                COMMAND_ERROR_EVENT,
-                {"error": f"Could not parse Control Command. {repr(e)}"},
-                namespace=CONTROL_NAMESPACE,
-                to=sid,
+            message = f"Could not parse Control Command. {repr(e)}"
+            logger.error(message)
+            self.send_command_error(message, sid)
+            return False, message
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Control command %s parsed, eio_sid %s, sid %s",
+                control_command.cmd_type,
+                self.get_eio_sid_of_control(sid),
+                sid,
             )
-            return False, f"Could not parse Control Command. {repr(e)}"
-
-        logger.info(
-            f"Control command {control_command.cmd_type} parsed, "
-            f"eio_sid {self.get_eio_sid_of_control(sid)}, sid {sid}"
-        )
 
+        if handler is not None:
+            return handler(control_command, sid)
         if self._command_callback:
             return self._command_callback(control_command, sid)
         else:
             return self.command_callback(control_command, sid)
 
+    def register_command(
+        self, cmd_type: ControlCmdType, handler: Callable[[ControlCommand, str], Tuple[bool, str]]
+    ) -> None:
+        """Register control command handler for the command type.
+
+        The handler is called instead of the command callback for commands of this type.
+
+        Args:
+            cmd_type (ControlCmdType): Control command type.
+            handler (Callable[[ControlCommand, str], Tuple[bool, str]]): Control command handler with parsed command
+                and namespace sid parameters.
+        """
+
+        self._command_handlers[cmd_type] = handler
+
     def data_disconnect_callback(self, sid: str) -> None:
         """On disconnect from DATA_NAMESPACE namespace callback.
 
@@ -272,14 +794,18 @@ class NetworkApplicationServer(Process):
             sid (str): Namespace sid.
         """
 
-        if self._disconnect_callback:
-            self._disconnect_callback(sid)
-        else:
-            self.disconnect_callback(sid)
-        logger.info(
-            f"Client with eio_sid {self.get_eio_sid_of_data(sid)} disconnected from {DATA_NAMESPACE} "
-            f"namespace, sid {sid}"
-        )
+        # The eio sid is resolved before the custom callback, which may dismantle the client state.
+        eio_sid = self.get_eio_sid_of_data(sid)
+        try:
+            if self._disconnect_callback:
+                self._disconnect_callback(sid)
+            else:
+                self.disconnect_callback(sid)
+        finally:
+            # The client state is cleaned up even if the custom callback fails.
+            self._dropped_counts.pop(sid, None)
+            self._forget_sid(sid, eio_sid, DATA_NAMESPACE)
+        logger.info("Client with eio_sid %s disconnected from %s namespace, sid %s", eio_sid, DATA_NAMESPACE, sid)
 
     def control_disconnect_callback(self, sid: str) -> None:
         """On disconnect from CONTROL_NAMESPACE namespace callback.
@@ -288,10 +814,9 @@ class NetworkApplicationServer(Process):
             sid (str): Namespace sid.
         """
 
-        logger.info(
-            f"Client with eio_sid {self.get_eio_sid_of_control(sid)} disconnected from {CONTROL_NAMESPACE} "
-            f"namespace, sid {sid}"
-        )
+        eio_sid = self.get_eio_sid_of_control(sid)
+        self._forget_sid(sid, eio_sid, CONTROL_NAMESPACE)
+        logger.info("Client with eio_sid %s disconnected from %s namespace, sid %s", eio_sid, CONTROL_NAMESPACE, sid)
 
     def command_callback(self, control_command: ControlCommand, sid: str) -> Tuple[bool, str]:
         """Control command callback with parsed command.